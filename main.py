@@ -1,8 +1,123 @@
+import functools
+import linecache
+import math
+import re
+import threading
 import tkinter as tk
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk
-from typing import Callable
+from types import MappingProxyType
+from typing import Callable, Mapping, Sequence
 import sympy as sp
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, vectorize
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+    # Без numba ядра остаются обычными Python-функциями
+    def njit(func=None, **options):
+        if func is None:
+            return lambda f: f
+        return func
+
+@njit(cache=True, nogil=True, fastmath={'contract'})
+def _linear_kernel(x: int, y: int, z: int) -> float:
+    """
+    Вычисляет значение выражения линейного алгоритма без округления.
+    При наличии numba компилируется в машинный код при первом вызове.
+    """
+    # Под numba целые аргументы имеют тип int64, поэтому все, кроме x^|y|,
+    # считается в float, чтобы произведения не переполнялись
+    x_float = float(x)
+    y_float = float(y)
+    # Синус выражения (x + y) в квадрате
+    s = math.sin(x_float + y_float)
+    # Числитель выражения
+    numerator = 1.0 + s * s
+    # Знаменатель выражения, квадраты вынесены в локальные переменные
+    x_squared = x_float * x_float
+    y_squared = y_float * y_float
+    denominator = abs(x_float - (2.0 * y_float) / (1.0 + x_squared * y_squared))
+    # Косинус квадрат арктангенса 1/z в замкнутой форме, без тригонометрии:
+    # cos^2(atan(t)) = 1 / (1 + t^2), при t = 1/z это z^2 / (z^2 + 1).
+    # Замкнутая форма определена и при z = 0, но исходное выражение - нет
+    if z == 0:
+        raise ZeroDivisionError("atan(1/z) не определен при z = 0")
+    z_float = float(z)
+    z_squared = z_float * z_float
+    cos_term = z_squared / (z_squared + 1.0)
+    # x^|y|: пока результат помещается в 63 бита, степень считается целочисленно
+    # (возведение в квадрат на C), иначе через math.pow без длинной арифметики
+    power = abs(y)
+    if power * math.log2(abs(x) + 1) < 63:
+        x_power = x ** power
+    else:
+        x_power = math.pow(x, power)
+    # Основное выражение для вычислений; записано одним выражением вида a * b + c,
+    # чтобы флаг contract позволил компилятору свести его к fused multiply-add.
+    # Остальные флаги fastmath не включаются: при огромных степенях результат inf
+    return (numerator / denominator) * x_power + cos_term
+
+@functools.lru_cache(maxsize=None)
+def _linear_ufunc():
+    """
+    Компилирует ядро линейного алгоритма в параллельную numpy-ufunc.
+    Компиляция выполняется при первом обращении, а не при запуске приложения.
+    """
+    signature = ['float64(float64, float64, float64)']
+    return vectorize(signature, target='parallel')(_linear_kernel.py_func)
+
+def _linear_element(x: float, y: float, z: float) -> float:
+    """
+    Скалярное ядро для расчета массивов без numba: деление на ноль и
+    переполнение дают ±inf, как в ufunc, вместо исключений.
+    """
+    try:
+        return _linear_kernel(x, y, z)
+    except (ZeroDivisionError, OverflowError):
+        # z = 0 - недопустимый ввод, ufunc тоже завершается исключением
+        if z == 0:
+            raise
+        # Числитель положителен, поэтому знак бесконечности задает x^|y|
+        negative = x < 0 and abs(y) % 2 == 1
+        return -math.inf if negative else math.inf
+
+def linear_algorithm_array(x, y, z):
+    """
+    Выполняет расчет по линейному алгоритму поэлементно для массивов значений.
+
+    Способ расчета зависит от установленных пакетов (extra "jit" ставит оба):
+        - numba и numpy: параллельная ufunc;
+        - только numpy: numpy.vectorize над скалярным ядром;
+        - без numpy: список по попарно взятым элементам одинаковых по длине
+          последовательностей, без broadcasting и скалярных аргументов.
+    Во всех случаях деление на ноль и переполнение дают ±inf, а z = 0
+    вызывает ZeroDivisionError.
+
+    Параметры:
+    x (array_like): Значения переменной x.
+    y (array_like): Значения переменной y.
+    z (array_like): Значения переменной z.
+
+    Возвращает:
+    numpy.ndarray | list[float]: Результаты вычислений без округления
+    (numpy.float64 для скалярных аргументов; list без numpy).
+    """
+    if _HAS_NUMBA:
+        return _linear_ufunc()(x, y, z)
+    if np is not None:
+        return np.vectorize(_linear_element, otypes=[float])(x, y, z)[()]
+    return [_linear_element(a, b, c) for a, b, c in zip(x, y, z, strict=True)]
+
+@functools.lru_cache(maxsize=256)
 def linear_algorithm(x: int, y: int, z: int, accuracy: int = 5) -> float:
     """
     Выполняет расчет по линейному алгоритму, который включает в себя 
@@ -17,25 +132,87 @@ def linear_algorithm(x: int, y: int, z: int, accuracy: int = 5) -> float:
     z (int): Переменная z, участвующая в вычислениях.
     accuracy (int, опционально): Точность вычислений (по умолчанию 5 знаков после запятой).
 
+    При установленной numba x, y и z должны помещаться в int64, иначе
+    вызывается OverflowError; интерфейс отклоняет такой ввод на обоих путях.
+
     Возвращает:
     float: Результат вычислений, округленный до указанной точности.
     """
-    # Синус выражения (x + y) в квадрате
-    sin_term = sp.sin(x + y)**2
-    # Числитель выражения
-    numerator = 1 + sin_term
-    # Знаменатель выражения
-    denominator_expression = (2 * y) / (1 + x**2 * y**2)
-    denominator = sp.Abs(x - denominator_expression)
-    # Косинус квадрат арктангенса 1/z
-    cos_term = sp.cos(sp.atan(1 / z))**2
-    # Основное выражение для вычислений
-    expression = (numerator / denominator) * x**sp.Abs(y) + cos_term
     # Округление результата до указанной точности
-    result = expression.evalf(accuracy)
-    return result
+    return round(_linear_kernel(x, y, z), accuracy)
+
+# Функции f(x), доступные для выбора в разветвляющемся алгоритме
+FUNCS: dict[str, Callable[[sp.Symbol], sp.Expr]] = {
+    "cot": sp.cot,
+    "sin": sp.sin,
+    "cos": sp.cos,
+    "tan": sp.tan,
+}
+
+# Тип скомпилированной скалярной функции от (x, y)
+Kernel = Callable[[float, float], float]
 
-def branching_algorithm(x_val: float, y_val: float, f_func: Callable[[sp.Symbol], sp.Expr]) -> float:
+def _select_branch(part1: Kernel, part2: Kernel, part3: Kernel) -> Kernel:
+    """
+    Объединяет скомпилированные ветви в одну функцию от (x, y), которая
+    выбирает ветвь по значению x * y. Результаты вызовов кэшируются.
+
+    Параметры:
+    part1 (Kernel): Ветвь для x * y > 12.
+    part2 (Kernel): Ветвь для x * y < 7.
+    part3 (Kernel): Ветвь для остальных случаев.
+
+    Возвращает:
+    Kernel: Функция разветвляющегося алгоритма от (x, y).
+    """
+    @functools.lru_cache(maxsize=256)
+    def kernel(x_val: float, y_val: float) -> float:
+        # Условия проверяются числом, без символьной кусочной функции
+        product = x_val * y_val
+        if product > 12:
+            return part1(x_val, y_val)
+        elif product < 7:
+            return part2(x_val, y_val)
+        else:
+            return part3(x_val, y_val)
+    return kernel
+
+def _build(func_name: str) -> Kernel:
+    """
+    Строит выражения ветвей разветвляющейся функции для выбранной f(x),
+    компилирует каждое в обычную Python-функцию через sympy.lambdify и
+    объединяет их в одну функцию от (x, y).
+
+    Параметры:
+    func_name (str): Имя функции f(x) из словаря FUNCS.
+
+    Возвращает:
+    Kernel: Скомпилированная функция разветвляющегося алгоритма от (x, y).
+    """
+    x, y = sp.symbols('x y')
+    # Применяем выбранную функцию к x и возводим результат в куб
+    f_cubed = FUNCS[func_name](x)**3
+    # Выражения для разных условий
+    part1 = f_cubed + sp.cot(y)
+    part2 = sp.sinh(f_cubed) + y**2
+    part3 = sp.cos(x - f_cubed)
+    try:
+        kernels = tuple(
+            njit(sp.lambdify((x, y), part, modules=['math']), nogil=True)
+            for part in (part1, part2, part3)
+        )
+    finally:
+        # lambdify сохраняет исходный код каждой функции в linecache
+        linecache.clearcache()
+    return _select_branch(*kernels)
+
+# Набор функций f(x) конечен, поэтому все ядра строятся один раз при импорте;
+# JIT-компиляция numba выполняется при первом вызове (см. CalculatorApp._warmup)
+_COMPILED: Mapping[str, Kernel] = MappingProxyType(
+    {func_name: _build(func_name) for func_name in FUNCS}
+)
+
+def branching_algorithm(x_val: float, y_val: float, func_name: str) -> float:
     """
     Выполняет вычисление значения разветвляющейся функции на основе заданных условий и математических операций.
     В зависимости от значений x и y функция может принимать одно из нескольких выражений.
@@ -48,28 +225,30 @@ def branching_algorithm(x_val: float, y_val: float, f_func: Callable[[sp.Symbol]
     Параметры:
     x_val (float): Значение переменной x.
     y_val (float): Значение переменной y.
-    f_func (Callable[[sp.Symbol], sp.Expr]): Функция f(x), которая будет применяться в выражениях.
+    func_name (str): Имя функции f(x) из словаря FUNCS ("cot", "sin", "cos", "tan").
 
     Возвращает:
     float: Результат вычислений в зависимости от выбранной функции и условий.
     """
-    x, y = sp.symbols('x y')
-    # Применяем выбранную функцию к x и возводим результат в куб
-    f_cubed = f_func(x)**3
-    # Выражения для разных условий
-    part1 = f_cubed + sp.cot(y)
-    part2 = sp.sinh(f_cubed) + y**2
-    part3 = sp.cos(x - f_cubed)
-    # Условия для выбора соответствующего выражения
-    condition1 = x * y > 12
-    condition2 = x * y < 7
-    # Кусочная функция, которая зависит от условий
-    func = sp.Piecewise((part1, condition1), (part2, condition2), (part3, True))
-    # Подставляем значения x и y и вычисляем результат
-    result = func.subs({x: x_val, y: y_val})
-    return result.evalf()
+    return _COMPILED[func_name](x_val, y_val)
+
+# Наибольшее число знаков после запятой, которое имеет смысл для float64
+_MAX_ACCURACY = 17
+
+# Наибольшее целое, которое ядро numba принимает как int64
+_INT64_MAX = 2**63 - 1
+
+# Допустимый ввод целых и вещественных чисел в полях ввода
+_INT_RE = re.compile(r'^-?\d+$')
+_FLOAT_RE = re.compile(r'^-?\d+(?:\.\d+)?$')
 
 class CalculatorApp:
+    # Изображения формул для каждого корневого окна, общие для экземпляров на одном
+    # окне; записи удаляются вместе с окном
+    _images: weakref.WeakKeyDictionary[tk.Tk, dict[str, tk.PhotoImage]] = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(self, root):
         """
         Инициализация приложения калькулятора.
@@ -90,117 +269,242 @@ class CalculatorApp:
         
         self.tab_control.pack(expand=1, fill="both")
 
+        # Кнопки расчета недоступны, пока ядра numba не скомпилированы;
+        # без numba прогревать нечего
+        self._kernels_ready = not _HAS_NUMBA
+        # Каждому значению выпадающего списка соответствует готовое ядро
+        self._kernels = _COMPILED
+        # Расчеты выполняются вне потока Tk, чтобы окно не зависало
+        self._pool = ThreadPoolExecutor(max_workers=1)
         self.create_linear_algorithm_widgets()
-        self.create_piecewise_function_widgets()
+        # Виджеты второй вкладки создаются при первом ее открытии
+        self._piecewise_widgets_created = False
+        self.tab_control.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
-    def create_linear_algorithm_widgets(self):
+        if not self._kernels_ready:
+            # Фоновый поток не обращается к Tk: поток Tk сам опрашивает событие
+            self._warmup_done = threading.Event()
+            threading.Thread(target=self._warmup, daemon=True).start()
+            self.root.after(50, self._poll_warmup)
+
+    def _warmup(self):
         """
-        Создает виджеты для ввода данных и отображения результата линейного алгоритма.
+        Компилирует вычислительные ядра в фоновом потоке, пока пользователь вводит данные.
         """
-        self.img = tk.PhotoImage(file="images/2.png")   
-        self.image_label = tk.Label(self.tab1, image=self.img)
-        self.image_label.grid(row=0, column=0, columnspan=2, pady=10)   
+        try:
+            # Прогрев ядра, чтобы первый клик не ждал JIT-компиляции
+            _linear_kernel(2, 1, 1)
+            # По одной точке на каждую ветвь: x * y > 12, x * y < 7 и остальные
+            for kernel in self._kernels.values():
+                for x_val, y_val in ((4.0, 4.0), (1.0, 1.0), (3.0, 3.0)):
+                    kernel(x_val, y_val)
+        finally:
+            self._warmup_done.set()
 
-        self.label_x = tk.Label(self.tab1, text="x:")
-        self.label_x.grid(row=1, column=0)
-        self.entry_x = tk.Entry(self.tab1)
-        self.entry_x.grid(row=1, column=1)
-        
-        self.label_y = tk.Label(self.tab1, text="y:")
-        self.label_y.grid(row=2, column=0)
-        self.entry_y = tk.Entry(self.tab1)
-        self.entry_y.grid(row=2, column=1)
-        
-        self.label_z = tk.Label(self.tab1, text="z:")
-        self.label_z.grid(row=3, column=0)
-        self.entry_z = tk.Entry(self.tab1)
-        self.entry_z.grid(row=3, column=1)
-
-        self.label_accuracy = tk.Label(self.tab1, text="Точность:")
-        self.label_accuracy.grid(row=4, column=0)
-        self.entry_accuracy = tk.Entry(self.tab1)
-        self.entry_accuracy.grid(row=4, column=1)
-        self.entry_accuracy.insert(0, "5")
+    def _poll_warmup(self):
+        """
+        Включает кнопки расчета после завершения прогрева; до этого
+        перепланирует проверку в цикле событий Tk.
+        """
+        if not self._warmup_done.is_set():
+            self.root.after(50, self._poll_warmup)
+            return
+        self._kernels_ready = True
+        self.calculate_button.config(state="normal")
+        if self._piecewise_widgets_created:
+            self.calculate_button2.config(state="normal")
 
-        self.result_label = tk.Label(self.tab1, text="Результат:")
-        self.result_label.grid(row=5, column=0)
+    def _button_state(self) -> str:
+        """
+        Возвращает состояние кнопки расчета в зависимости от готовности ядер.
+        """
+        return "normal" if self._kernels_ready else "disabled"
 
-        self.result_display = tk.Label(self.tab1, text="")
-        self.result_display.grid(row=5, column=1)
+    def _on_tab_changed(self, event):
+        """
+        Создает виджеты разветвляющегося алгоритма при первом переходе на его вкладку.
+        """
+        if self._piecewise_widgets_created:
+            return
+        if self.tab_control.index("current") == self.tab_control.index(self.tab2):
+            self._piecewise_widgets_created = True
+            self.create_piecewise_function_widgets()
 
-        self.calculate_button = tk.Button(self.tab1, text="Рассчитать", command=self.calculate_linear_algorithm)
-        self.calculate_button.grid(row=6, columnspan=2)
+    def _load_image(self, filename: str) -> tk.PhotoImage:
+        """
+        Загружает изображение из файла в интерпретатор Tcl окна приложения.
+        Изображения кэшируются для каждого корневого окна отдельно: изображение
+        одного интерпретатора нельзя показать в другом.
 
-    def create_piecewise_function_widgets(self):
+        Параметры:
+        filename (str): Путь к файлу изображения.
+
+        Возвращает:
+        tk.PhotoImage: Загруженное изображение.
         """
-        Создает виджеты для ввода данных и отображения результата разветвляющегося алгоритма .
+        images = self._images.setdefault(self.root, {})
+        image = images.get(filename)
+        if image is None:
+            image = tk.PhotoImage(master=self.root, file=filename)
+            images[filename] = image
+        return image
+
+    def _build_form(
+        self,
+        tab: ttk.Frame,
+        image_file: str,
+        fields: Sequence[tuple[str, str, Callable[[ttk.Frame], tk.Widget]]],
+        on_click: Callable[[], None],
+    ) -> tuple[tk.Label, tk.Button]:
         """
-        self.img2 = tk.PhotoImage(file="images/1.png")   
-        self.image_label2 = tk.Label(self.tab2, image=self.img2)
-        self.image_label2.grid(row=0, column=0, columnspan=2, pady=10) 
+        Создает на вкладке изображение формулы, поля ввода по описанию,
+        строку результата и кнопку расчета.
 
-        self.label_x2 = tk.Label(self.tab2, text="x:")
-        self.label_x2.grid(row=1, column=0)
-        self.entry_x2 = tk.Entry(self.tab2)
-        self.entry_x2.grid(row=1, column=1)
+        Параметры:
+        tab (ttk.Frame): Вкладка, на которой размещаются виджеты.
+        image_file (str): Путь к изображению формулы.
+        fields (Sequence[tuple[str, str, Callable[[ttk.Frame], tk.Widget]]]):
+            Описание полей (имя атрибута, подпись, фабрика виджета);
+            созданный виджет сохраняется в атрибут с указанным именем.
+        on_click (Callable[[], None]): Обработчик кнопки расчета.
 
-        self.label_y2 = tk.Label(self.tab2, text="y:")
-        self.label_y2.grid(row=2, column=0)
-        self.entry_y2 = tk.Entry(self.tab2)
-        self.entry_y2.grid(row=2, column=1)
+        Возвращает:
+        tuple[tk.Label, tk.Button]: Виджет результата и кнопка расчета.
+        """
+        tk.Label(tab, image=self._load_image(image_file)).grid(row=0, column=0, columnspan=2, pady=10)
 
-        self.label_func = tk.Label(self.tab2, text="Выберите функцию:")
-        self.label_func.grid(row=3, column=0)
-        self.func_combobox = ttk.Combobox(self.tab2, values=["cot", "sin", "cos", "tan"], state="readonly")
-        self.func_combobox.grid(row=3, column=1)
-        self.func_combobox.set("cot")   
+        for row, (attribute, text, factory) in enumerate(fields, start=1):
+            tk.Label(tab, text=text).grid(row=row, column=0)
+            widget = factory(tab)
+            widget.grid(row=row, column=1)
+            setattr(self, attribute, widget)
 
-        self.result_label2 = tk.Label(self.tab2, text="Результат:")
-        self.result_label2.grid(row=4, column=0)
+        result_row = len(fields) + 1
+        tk.Label(tab, text="Результат:").grid(row=result_row, column=0)
+        result_display = tk.Label(tab, text="")
+        result_display.grid(row=result_row, column=1)
 
-        self.result_display2 = tk.Label(self.tab2, text="")
-        self.result_display2.grid(row=4, column=1)
+        button = tk.Button(tab, text="Рассчитать", command=on_click, state=self._button_state())
+        button.grid(row=result_row + 1, columnspan=2)
+        return result_display, button
 
-        self.calculate_button2 = tk.Button(self.tab2, text="Рассчитать", command=self.calculate_piecewise_function)
-        self.calculate_button2.grid(row=5, columnspan=2)
+    def create_linear_algorithm_widgets(self):
+        """
+        Создает виджеты для ввода данных и отображения результата линейного алгоритма.
+        """
+        fields = [
+            ("entry_x", "x:", tk.Entry),
+            ("entry_y", "y:", tk.Entry),
+            ("entry_z", "z:", tk.Entry),
+            ("entry_accuracy", "Точность:", tk.Entry),
+        ]
+        self.result_display, self.calculate_button = self._build_form(
+            self.tab1, "images/2.png", fields, self.calculate_linear_algorithm
+        )
+        self.entry_accuracy.insert(0, "5")
+
+    def create_piecewise_function_widgets(self):
+        """
+        Создает виджеты для ввода данных и отображения результата разветвляющегося алгоритма .
+        """
+        fields = [
+            ("entry_x2", "x:", tk.Entry),
+            ("entry_y2", "y:", tk.Entry),
+            ("func_combobox", "Выберите функцию:",
+             lambda tab: ttk.Combobox(tab, values=list(FUNCS), state="readonly")),
+        ]
+        self.result_display2, self.calculate_button2 = self._build_form(
+            self.tab2, "images/1.png", fields, self.calculate_piecewise_function
+        )
+        self.func_combobox.set("cot")
 
     def calculate_linear_algorithm(self):
         """
         Выполняет расчет линейного алгоритма, получая данные из полей ввода
         и отображая результат в соответствующем виджете.
         """
+        entries = (self.entry_x, self.entry_y, self.entry_z, self.entry_accuracy)
+        values = [entry.get().strip() for entry in entries]
+        # Ввод проверяется заранее, без исключений от int()
+        if not all(_INT_RE.match(value) for value in values):
+            self.result_display.config(text="Неверный ввод")
+            return
         try:
-            x = int(self.entry_x.get())
-            y = int(self.entry_y.get())
-            z = int(self.entry_z.get())
-            accuracy = int(self.entry_accuracy.get())
-            result = linear_algorithm(x, y, z, accuracy)
-            self.result_display.config(text=f"{result:.5f}")
+            x, y, z, accuracy = map(int, values)
         except ValueError:
+            # Регулярное выражение не ограничивает длину: int() отвергает
+            # строки длиннее sys.get_int_max_str_digits() цифр
             self.result_display.config(text="Неверный ввод")
+            return
+        # Точность ограничена числом значащих цифр float64: большие значения
+        # дают выдуманные цифры, а огромные строят гигантскую строку в потоке Tk
+        if not 0 <= accuracy <= _MAX_ACCURACY:
+            self.result_display.config(text="Неверный ввод")
+            return
+        # Ядра numba принимают только int64; то же ограничение действует и без numba
+        if not all(abs(value) <= _INT64_MAX for value in (x, y, z)):
+            self.result_display.config(text="Неверный ввод")
+            return
+        # Точность определяет число знаков после запятой при выводе
+        self._submit(self.result_display, accuracy, linear_algorithm, x, y, z, accuracy)
 
     def calculate_piecewise_function(self):
         """
         Выполняет расчет разветвляющейся функции, получая данные из полей ввода
         и отображая результат в соответствующем виджете.
         """
-        try:
-            x = float(self.entry_x2.get())
-            y = float(self.entry_y2.get())
-            selected_func = self.func_combobox.get()
-            
-            func_dict = {
-                "cot": sp.cot,
-                "sin": sp.sin,
-                "cos": sp.cos,
-                "tan": sp.tan,
-            }
-            
-            f_func = func_dict[selected_func]
-            result = branching_algorithm(x, y, f_func)
-            self.result_display2.config(text=f"{result:.5f}")
-        except ValueError:
+        values = [entry.get().strip() for entry in (self.entry_x2, self.entry_y2)]
+        # Ввод проверяется заранее, без исключений от float()
+        if not all(_FLOAT_RE.match(value) for value in values):
+            self.result_display2.config(text="Неверный ввод")
+            return
+        x, y = map(float, values)
+        # Регулярное выражение не ограничивает длину: слишком длинное число
+        # float() превращает в inf
+        if not (math.isfinite(x) and math.isfinite(y)):
             self.result_display2.config(text="Неверный ввод")
+            return
+        kernel = self._kernels[self.func_combobox.get()]
+        self._submit(self.result_display2, 5, kernel, x, y)
+
+    def _submit(self, display: tk.Label, precision: int, func: Callable[..., float], *args):
+        """
+        Выполняет расчет в рабочем потоке и выводит результат в главном потоке Tk.
+
+        Параметры:
+        display (tk.Label): Виджет для вывода результата.
+        precision (int): Число знаков после запятой при выводе.
+        func (Callable[..., float]): Функция расчета.
+        *args: Аргументы функции расчета.
+        """
+        future = self._pool.submit(func, *args)
+        # Рабочий поток не обращается к Tk: поток Tk сам опрашивает future
+        self.root.after(20, self._show_result, display, precision, future)
+
+    def _show_result(self, display: tk.Label, precision: int, future: Future):
+        """
+        Отображает результат расчета или сообщение о неверном вводе;
+        пока расчет не завершен, перепланирует проверку в цикле событий Tk.
+
+        Параметры:
+        display (tk.Label): Виджет для вывода результата.
+        precision (int): Число знаков после запятой при выводе.
+        future (Future): Выполняемый расчет.
+        """
+        if not future.done():
+            self.root.after(20, self._show_result, display, precision, future)
+            return
+        try:
+            result = future.result()
+        except (ValueError, ZeroDivisionError, OverflowError):
+            display.config(text="Неверный ввод")
+            return
+        # Под numba переполнение дает inf/nan вместо OverflowError; результат
+        # показывается одинаково независимо от того, установлена ли numba
+        if not math.isfinite(result):
+            display.config(text="Неверный ввод")
+            return
+        display.config(text=f"{result:.{precision}f}")
 
 if __name__ == "__main__":
     root = tk.Tk()